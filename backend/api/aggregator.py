@@ -20,17 +20,173 @@ From PLAN.md:
 - 1M = Calendar month aggregation
 """
 
-from typing import List, Dict
+from typing import List, Dict, Union
 from datetime import datetime, timedelta
 import logging
+import time
 from collections import deque
+from itertools import islice
 import calendar
 
-from .cache import OHLCV
+import numpy as np
+import pandas as pd
+
+from .cache import OHLCV, OHLCVArray
+from ._aggregate_nb import _agg_loop, _ring_extrema_nb, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
 
+def _fused_hlv(bars) -> tuple:
+    """
+    Compute (high, low, volume_sum) over bars in a single pass.
+
+    One sweep with scalar accumulators instead of three generator
+    expressions - one iterator allocation and one round of attribute
+    lookups per bar rather than three.
+    """
+    it = iter(bars)
+    first = next(it)
+    high = first.high
+    low = first.low
+    volume = first.volume
+
+    for bar in it:
+        if bar.high > high:
+            high = bar.high
+        if bar.low < low:
+            low = bar.low
+        volume += bar.volume
+
+    return high, low, volume
+
+
+def _month_key(timestamp: float) -> int:
+    """
+    Integer calendar-month key for a timestamp (year * 12 + month).
+
+    Computed once per daily bar so month-boundary detection is a plain
+    integer compare instead of a datetime.fromtimestamp call per bar.
+    """
+    tm = time.gmtime(timestamp)
+    return tm.tm_year * 12 + tm.tm_mon
+
+
+class RollingWindow:
+    """
+    Fixed-size ring buffer of 1m bars with O(1) rolling OHLCV aggregates.
+
+    Bars are stored in preallocated NumPy arrays indexed by a wrapping cursor.
+    Rolling max/min are maintained with monotonic deques (decreasing for highs,
+    increasing for lows) and volume with a running sum updated on add/evict,
+    so each push is amortized O(1) instead of a fresh O(N) reduction over a
+    copied buffer.
+
+    For small windows (<= SCAN_THRESHOLD slots, numba available) the deques
+    are skipped entirely: their per-push tuple allocations cost more than a
+    JIT-compiled branchless scan of the whole ring at aggregation time.
+    """
+
+    # Windows at or below this size use the ring-scan kernel instead of deques
+    SCAN_THRESHOLD = 64
+
+    def __init__(self, size: int):
+        self._size = size
+        self._times = np.empty(size, dtype=np.float64)
+        self._opens = np.empty(size, dtype=np.float64)
+        self._highs = np.empty(size, dtype=np.float64)
+        self._lows = np.empty(size, dtype=np.float64)
+        self._closes = np.empty(size, dtype=np.float64)
+        self._volumes = np.empty(size, dtype=np.float64)
+        self._cursor = 0      # Next write slot
+        self._count = 0       # Number of valid bars
+        self._seq = 0         # Monotonic push counter (deque entry tags)
+
+        self._use_scan = NUMBA_AVAILABLE and size <= self.SCAN_THRESHOLD
+
+        # Monotonic deques of (seq, value): _max_q decreasing, _min_q increasing
+        self._max_q: deque = deque()
+        self._min_q: deque = deque()
+        self._volume_sum = 0.0
+
+    def push(self, bar: OHLCV) -> None:
+        """Add a bar, evicting the oldest when the window is full."""
+        if self._count == self._size:
+            if not self._use_scan:
+                # Evict oldest: drop its volume and expire stale extrema entries
+                evicted_seq = self._seq - self._size
+                self._volume_sum -= self._volumes[self._cursor]
+                if self._max_q and self._max_q[0][0] == evicted_seq:
+                    self._max_q.popleft()
+                if self._min_q and self._min_q[0][0] == evicted_seq:
+                    self._min_q.popleft()
+        else:
+            self._count += 1
+
+        self._times[self._cursor] = bar.time
+        self._opens[self._cursor] = bar.open
+        self._highs[self._cursor] = bar.high
+        self._lows[self._cursor] = bar.low
+        self._closes[self._cursor] = bar.close
+        self._volumes[self._cursor] = bar.volume
+        self._cursor = (self._cursor + 1) % self._size
+        self._seq += 1
+
+        if self._use_scan:
+            # Ring write is all the bookkeeping needed in scan mode
+            return
+
+        # Maintain monotonic extrema deques
+        while self._max_q and self._max_q[-1][1] <= bar.high:
+            self._max_q.pop()
+        self._max_q.append((self._seq - 1, bar.high))
+
+        while self._min_q and self._min_q[-1][1] >= bar.low:
+            self._min_q.pop()
+        self._min_q.append((self._seq - 1, bar.low))
+
+        self._volume_sum += bar.volume
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def is_full(self) -> bool:
+        return self._count == self._size
+
+    def aggregate(self, aligned_time: int) -> OHLCV:
+        """Return the aggregated OHLCV over the current window contents."""
+        if self._count == 0:
+            raise ValueError("Cannot aggregate empty rolling window")
+
+        oldest = (self._cursor - self._count) % self._size
+        newest = (self._cursor - 1) % self._size
+
+        if self._use_scan:
+            high, low, volume = _ring_extrema_nb(
+                self._highs, self._lows, self._volumes, self._cursor, self._count
+            )
+        else:
+            high = self._max_q[0][1]
+            low = self._min_q[0][1]
+            volume = self._volume_sum
+
+        return OHLCV(
+            time=aligned_time,
+            open=float(self._opens[oldest]),
+            high=float(high),
+            low=float(low),
+            close=float(self._closes[newest]),
+            volume=float(volume)
+        )
+
+    @property
+    def oldest_time(self) -> float:
+        if self._count == 0:
+            raise ValueError("Rolling window is empty")
+        return float(self._times[(self._cursor - self._count) % self._size])
+
+
 class TimeframeAggregator:
     """
     Aggregates 1-minute bars into all 9 timeframe bars.
@@ -56,15 +212,23 @@ class TimeframeAggregator:
     }
 
     def __init__(self):
-        """Initialize aggregator with time-based grouping for each timeframe"""
-        # Group 1m bars by aligned timeframe timestamp
-        # Structure: {aligned_timestamp: [OHLCV bars]}
-        self._time_groups: Dict[str, Dict[int, List[OHLCV]]] = {
-            "5m": {},
-            "15m": {},
-            "30m": {},
-            "1H": {},
-            "4H": {},
+        """Initialize aggregator with incremental per-timeframe state"""
+        # Hot-loop iteration order: (timeframe, seconds_in_period) tuples
+        # precomputed from TIMEFRAMES so add_1m_bar does integer arithmetic
+        # instead of class-dict lookups per tick
+        self._intraday = tuple(
+            (tf, self.TIMEFRAMES[tf][1]) for tf in ("5m", "15m", "30m", "1H", "4H")
+        )
+
+        # In-progress bar per intraday timeframe, keyed by timeframe.
+        # Each new 1m bar folds into the current bar in O(1) (running
+        # high/low/close/volume); a new aligned timestamp starts a new bar.
+        self._current_bars: Dict[str, OHLCV] = {
+            "5m": None,
+            "15m": None,
+            "30m": None,
+            "1H": None,
+            "4H": None,
         }
 
         # Track the most recent completed bar for each timeframe
@@ -76,13 +240,23 @@ class TimeframeAggregator:
             "4H": None,
         }
 
-        # Store 1m bars for daily aggregation (still use rolling buffer)
-        self._daily_buffer: deque = deque(maxlen=1440)
+        # Ring buffer of 1m bars for daily aggregation with O(1) rolling
+        # extrema instead of a per-tick copy + full reduction
+        self._daily_window = RollingWindow(self.TIMEFRAMES["1D"][0])
 
-        # Store aggregated daily bars for weekly/monthly
-        self._daily_bars: List[OHLCV] = []
+        # Completed calendar-day bars for weekly/monthly, plus a parallel
+        # deque of integer month keys (year * 12 + month) for O(1)
+        # month-boundary detection. Bars are appended once per day rollover,
+        # so 64 entries cover ~3 months - weekly needs the last 5 days and
+        # monthly at most ~31, so unbounded growth buys nothing.
+        self._daily_bars: deque = deque(maxlen=64)
+        self._daily_month_keys: deque = deque(maxlen=64)
 
-        logger.info("Initialized TimeframeAggregator with time-based grouping")
+        # In-progress calendar-day bar; folded per tick and moved into
+        # _daily_bars when the day rolls over
+        self._current_daily: OHLCV = None
+
+        logger.info("Initialized TimeframeAggregator with incremental aggregation")
 
     def add_1m_bar(self, bar: OHLCV) -> Dict[str, List[OHLCV]]:
         """
@@ -101,94 +275,189 @@ class TimeframeAggregator:
         # 1m is just the bar itself
         result["1m"] = [bar]
 
-        # Add to daily buffer
-        self._daily_buffer.append(bar)
+        # Add to daily rolling window (O(1) amortized)
+        self._daily_window.push(bar)
 
-        # Get the bar's datetime
+        # Compute local-midnight offset once; per-timeframe alignment then
+        # reduces to integer division (equivalent to the replace()-based
+        # alignment for all intraday periods, which stay within one day)
         bar_dt = datetime.fromtimestamp(bar.time)
-
-        # Update each intraday timeframe
-        for timeframe in ["5m", "15m", "30m", "1H", "4H"]:
-            # Calculate aligned timestamp for this bar
-            aligned_dt = self._align_to_timeframe_boundary(bar_dt, timeframe)
-            aligned_ts = int(aligned_dt.timestamp())
-
-            # Add bar to the appropriate time group
-            if aligned_ts not in self._time_groups[timeframe]:
-                self._time_groups[timeframe][aligned_ts] = []
-            self._time_groups[timeframe][aligned_ts].append(bar)
-
-            # Clean up old time groups (keep only current and previous)
-            self._cleanup_old_groups(timeframe, aligned_ts)
-
-            # Get the current time group (in-progress bar)
-            current_group = self._time_groups[timeframe][aligned_ts]
-
-            # Aggregate the current group
-            current_bar = self._aggregate_bars(current_group, timeframe)
-
-            # Check if the timeframe period has ended
-            # (i.e., we have a new aligned timestamp that's different from previous)
-            previous_aligned = self._last_completed[timeframe]
-            if previous_aligned is not None:
-                prev_dt = datetime.fromtimestamp(previous_aligned.time)
-                if aligned_dt > prev_dt:
-                    # Timeframe period ended, the previous bar is complete
-                    result[timeframe] = [current_bar]
-                    self._last_completed[timeframe] = current_bar
-                else:
-                    # Still in the same period, send update for in-progress bar
-                    result[timeframe] = [current_bar]
-                    self._last_completed[timeframe] = current_bar
+        seconds_into_day = bar_dt.hour * 3600 + bar_dt.minute * 60 + bar_dt.second
+        day_start = int(bar.time) - seconds_into_day
+
+        # Update each intraday timeframe incrementally
+        for timeframe, period_seconds in self._intraday:
+            # Calculate aligned timestamp for this bar (pure int arithmetic)
+            aligned_ts = day_start + (seconds_into_day // period_seconds) * period_seconds
+
+            current_bar = self._current_bars[timeframe]
+
+            if current_bar is None or current_bar.time != aligned_ts:
+                # New period started - begin a fresh in-progress bar
+                current_bar = OHLCV(
+                    time=aligned_ts,
+                    open=bar.open,
+                    high=bar.high,
+                    low=bar.low,
+                    close=bar.close,
+                    volume=bar.volume
+                )
+                self._current_bars[timeframe] = current_bar
             else:
-                # First bar for this timeframe
-                result[timeframe] = [current_bar]
-                self._last_completed[timeframe] = current_bar
-
-        # Aggregate to daily (1D) - different logic, still using rolling buffer
-        if len(self._daily_buffer) >= self.TIMEFRAMES["1D"][0]:
-            daily_bar = self._aggregate_bars(
-                list(self._daily_buffer),
-                "1D"
+                # Still in the same period - fold the 1m bar in, O(1)
+                if bar.high > current_bar.high:
+                    current_bar.high = bar.high
+                if bar.low < current_bar.low:
+                    current_bar.low = bar.low
+                current_bar.close = bar.close
+                current_bar.volume += bar.volume
+
+            result[timeframe] = [current_bar]
+            self._last_completed[timeframe] = current_bar
+
+        # Fold into the in-progress calendar-day bar; a day rollover
+        # completes it and stores it for weekly/monthly aggregation
+        current_daily = self._current_daily
+        if current_daily is None or current_daily.time != day_start:
+            if current_daily is not None:
+                self._daily_bars.append(current_daily)
+                self._daily_month_keys.append(_month_key(current_daily.time))
+            current_daily = OHLCV(
+                time=day_start,
+                open=bar.open,
+                high=bar.high,
+                low=bar.low,
+                close=bar.close,
+                volume=bar.volume
             )
+            self._current_daily = current_daily
+        else:
+            if bar.high > current_daily.high:
+                current_daily.high = bar.high
+            if bar.low < current_daily.low:
+                current_daily.low = bar.low
+            current_daily.close = bar.close
+            current_daily.volume += bar.volume
+
+        # Aggregate to daily (1D) from the rolling window, O(1) per tick
+        if self._daily_window.is_full:
+            first_dt = datetime.fromtimestamp(self._daily_window.oldest_time)
+            aligned_day = self._align_to_timeframe_boundary(first_dt, "1D")
+            daily_bar = self._daily_window.aggregate(int(aligned_day.timestamp()))
             result["1D"] = [daily_bar]
 
-            # Store daily bar for weekly/monthly aggregation
-            self._daily_bars.append(daily_bar)
+        # Aggregate to weekly (1W) - 4 completed days plus the current day
+        if len(self._daily_bars) >= 4:
+            result["1W"] = [self._aggregate_days(4, "1W")]
+
+        # Aggregate to monthly (1M) - group by calendar month
+        result["1M"] = [self._aggregate_monthly()]
+
+        return result
 
-            # Aggregate to weekly (1W) - need 5 daily bars
-            if len(self._daily_bars) >= 5:
-                weekly_bars = self._daily_bars[-5:]
-                weekly_bar = self._aggregate_bars(weekly_bars, "1W")
-                result["1W"] = [weekly_bar]
+    def add_1m_bars_bulk(self, arr: OHLCVArray) -> Dict[str, List[OHLCV]]:
+        """
+        Add a batch of 1m bars from SoA arrays and update all timeframes.
 
-            # Aggregate to monthly (1M) - group by calendar month
-            monthly_bar = self._aggregate_monthly(self._daily_bars)
-            if monthly_bar:
-                result["1M"] = [monthly_bar]
+        Bulk variant of add_1m_bar for burst ingestion (initial 100+ bar
+        dump, backfills). The six columns are unboxed to Python floats once
+        with .tolist() - a single C pass per column instead of one NumPy
+        scalar conversion per field per bar - and the merged result carries
+        each in-progress bar at most once per period, however many 1m bars
+        folded into it.
+
+        Args:
+            arr: 1-minute bars as an OHLCVArray (chronological order)
+
+        Returns:
+            Dictionary mapping timeframe to the bars updated by this batch
+        """
+        result: Dict[str, List[OHLCV]] = {}
+        if len(arr) == 0:
+            return result
+
+        times = arr.times.tolist()
+        opens = arr.opens.tolist()
+        highs = arr.highs.tolist()
+        lows = arr.lows.tolist()
+        closes = arr.closes.tolist()
+        volumes = arr.volumes.tolist()
+
+        for i in range(len(times)):
+            bar = OHLCV(
+                time=times[i],
+                open=opens[i],
+                high=highs[i],
+                low=lows[i],
+                close=closes[i],
+                volume=volumes[i]
+            )
+            for timeframe, tf_bars in self.add_1m_bar(bar).items():
+                out = result.get(timeframe)
+                if out is None:
+                    out = result[timeframe] = []
+                for tf_bar in tf_bars:
+                    # Successive ticks re-emit the same period (mutated
+                    # in-progress bars, recomputed 1W/1M snapshots) - keep
+                    # only the latest state per period timestamp
+                    if out and out[-1].time == tf_bar.time:
+                        out[-1] = tf_bar
+                    else:
+                        out.append(tf_bar)
 
         return result
 
-    def _cleanup_old_groups(self, timeframe: str, current_aligned_ts: int) -> None:
+    def _aggregate_days(self, completed_count: int, timeframe: str) -> OHLCV:
         """
-        Remove old time groups to prevent memory bloat.
-        Keeps only the current and previous time groups.
+        Aggregate trailing completed daily bars plus the in-progress day.
+
+        Reduces the last `completed_count` bars of _daily_bars with a fused
+        islice pass, then folds _current_daily in O(1) - no list is
+        materialized on the tick path.
+
+        Args:
+            completed_count: Number of trailing completed days to include
+            timeframe: Target timeframe string (1W or 1M)
+
+        Returns:
+            Aggregated OHLCV bar ending at the in-progress day
         """
-        # Get all aligned timestamps for this timeframe
-        all_timestamps = list(self._time_groups[timeframe].keys())
+        current = self._current_daily
+
+        if completed_count > 0:
+            start = len(self._daily_bars) - completed_count
+            first = self._daily_bars[start]
+            high, low, volume = _fused_hlv(islice(self._daily_bars, start, None))
+            if current.high > high:
+                high = current.high
+            if current.low < low:
+                low = current.low
+            volume += current.volume
+        else:
+            first = current
+            high, low, volume = current.high, current.low, current.volume
 
-        # Remove timestamps that are more than 2 periods old
-        for ts in all_timestamps:
-            if ts < current_aligned_ts - (2 * self.TIMEFRAMES[timeframe][1]):
-                del self._time_groups[timeframe][ts]
-                logger.debug(f"Cleaned up old {timeframe} group: {ts}")
+        first_bar_time = datetime.fromtimestamp(first.time)
+        aligned_time = self._align_to_timeframe_boundary(first_bar_time, timeframe)
+
+        return OHLCV(
+            time=int(aligned_time.timestamp()),
+            open=first.open,
+            high=high,
+            low=low,
+            close=current.close,
+            volume=volume
+        )
 
     def _aggregate_bars(self, bars: List[OHLCV], timeframe: str) -> OHLCV:
         """
-        Aggregate a list of bars into a single higher timeframe bar.
+        Aggregate a sequence of bars into a single higher timeframe bar.
+
+        Accepts any indexable sequence (list, deque, OHLCVArray) - callers
+        should pass their container directly rather than copying it.
 
         Args:
-            bars: List of 1-minute or daily bars
+            bars: Sequence of 1-minute or daily bars
             timeframe: Target timeframe string
 
         Returns:
@@ -201,14 +470,15 @@ class TimeframeAggregator:
         first_bar_time = datetime.fromtimestamp(bars[0].time)
         aligned_time = self._align_to_timeframe_boundary(first_bar_time, timeframe)
 
-        # Aggregate OHLCV
+        # Aggregate OHLCV (single fused pass over the bars)
+        high, low, volume = _fused_hlv(bars)
         aggregated = OHLCV(
             time=int(aligned_time.timestamp()),
             open=bars[0].open,
-            high=max(bar.high for bar in bars),
-            low=min(bar.low for bar in bars),
+            high=high,
+            low=low,
             close=bars[-1].close,
-            volume=sum(bar.volume for bar in bars)
+            volume=volume
         )
 
         logger.debug(f"Aggregated {len(bars)} bars to {timeframe}: {aggregated}")
@@ -260,39 +530,27 @@ class TimeframeAggregator:
             logger.warning(f"Unknown timeframe {timeframe}, returning original time")
             return dt
 
-    def _aggregate_monthly(self, daily_bars: List[OHLCV]) -> OHLCV:
+    def _aggregate_monthly(self) -> OHLCV:
         """
-        Aggregate daily bars into monthly bars by calendar month.
+        Aggregate daily bars into a monthly bar for the current calendar month.
 
-        Args:
-            daily_bars: List of daily bars
+        Walks the stored completed days from the end comparing precomputed
+        integer month keys - no datetime conversion per bar - then folds the
+        in-progress day on top.
 
         Returns:
-            Monthly aggregated bar for current month, or None if insufficient data
+            Month-to-date aggregated bar for the current month
         """
-        if not daily_bars:
-            return None
-
-        # Get current month from latest bar
-        latest_bar = daily_bars[-1]
-        latest_date = datetime.fromtimestamp(latest_bar.time)
-
-        # Filter bars for current month
-        current_month_bars = []
-        for bar in reversed(daily_bars):
-            bar_date = datetime.fromtimestamp(bar.time)
-            if bar_date.month == latest_date.month and bar_date.year == latest_date.year:
-                current_month_bars.append(bar)
-            else:
-                break  # Different month, stop
+        current_key = _month_key(self._current_daily.time)
 
-        if not current_month_bars:
-            return None
+        # Count the run of current-month bars at the tail (scan from the end)
+        count = 0
+        for key in reversed(self._daily_month_keys):
+            if key != current_key:
+                break
+            count += 1
 
-        # Reverse to maintain chronological order
-        current_month_bars = list(reversed(current_month_bars))
-
-        return self._aggregate_bars(current_month_bars, "1M")
+        return self._aggregate_days(count, "1M")
 
     def get_all_timeframe_bars(self, timeframe: str, count: int = 100) -> List[OHLCV]:
         """
@@ -365,20 +623,26 @@ def _align_historical_to_boundary(dt: datetime, timeframe: str) -> datetime:
 
 
 def aggregate_historical_1m_to_timeframe(
-    bars_1m: List[OHLCV],
+    bars_1m: Union[List[OHLCV], OHLCVArray],
     target_timeframe: str
-) -> List[OHLCV]:
+) -> Union[List[OHLCV], OHLCVArray]:
     """
     Aggregate historical 1m bars into a higher timeframe.
 
     Used for initial historical data loading.
 
+    Bars are grouped into wall-clock buckets by `time // period_seconds`,
+    so bars land on real boundaries even across session gaps. With numba
+    available the whole series is reduced in one JIT-compiled pass; the
+    fallback reduces the same buckets with reduceat over the SoA arrays,
+    so both paths produce identical output.
+
     Args:
-        bars_1m: List of 1-minute OHLCV bars (chronological order)
+        bars_1m: 1-minute OHLCV bars (chronological order)
         target_timeframe: Target timeframe (5m, 15m, 30m, 1H, 4H, 1D)
 
     Returns:
-        List of aggregated bars for target timeframe
+        Aggregated bars for target timeframe
     """
     if target_timeframe == "1m":
         return bars_1m
@@ -391,102 +655,107 @@ def aggregate_historical_1m_to_timeframe(
     if bars_needed is None:
         raise ValueError(f"Cannot aggregate to {target_timeframe} (variable bars)")
 
-    if bars_needed == 5:  # Weekly aggregation
+    if target_timeframe == "1W":  # Weekly aggregation
         # First aggregate to daily, then to weekly
         daily_bars = _aggregate_to_daily(bars_1m)
         return _aggregate_to_weekly(daily_bars)
 
-    # Standard intraday aggregation using time-based grouping
-    # Group bars by aligned timeframe timestamp
-    time_groups = {}
-
-    for bar in bars_1m:
-        bar_dt = datetime.fromtimestamp(bar.time)
-        aligned_dt = _align_historical_to_boundary(bar_dt, target_timeframe)
-        aligned_ts = int(aligned_dt.timestamp())
-
-        if aligned_ts not in time_groups:
-            time_groups[aligned_ts] = []
-        time_groups[aligned_ts].append(bar)
-
-    # Aggregate each time group
-    aggregated_bars = []
-    for aligned_ts in sorted(time_groups.keys()):
-        group = time_groups[aligned_ts]
-
-        # Create aggregated bar
-        bar = OHLCV(
-            time=aligned_ts,
-            open=group[0].open,
-            high=max(b.high for b in group),
-            low=min(b.low for b in group),
-            close=group[-1].close,
-            volume=sum(b.volume for b in group)
+    # Convert to SoA arrays once (no-op if already an OHLCVArray)
+    arr = bars_1m if isinstance(bars_1m, OHLCVArray) else OHLCVArray.from_bars(bars_1m)
+
+    if len(arr) == 0:
+        return OHLCVArray.from_bars([])
+
+    period_seconds = TimeframeAggregator.TIMEFRAMES[target_timeframe][1]
+
+    # JIT bucket kernel: groups by wall-clock period (time // seconds), so
+    # bars land on real boundaries even across session gaps, and the whole
+    # series is reduced in one fused pass
+    if NUMBA_AVAILABLE:
+        times, opens, highs, lows, closes, volumes = _agg_loop(
+            np.ascontiguousarray(arr.times),
+            np.ascontiguousarray(arr.opens),
+            np.ascontiguousarray(arr.highs),
+            np.ascontiguousarray(arr.lows),
+            np.ascontiguousarray(arr.closes),
+            np.ascontiguousarray(arr.volumes),
+            period_seconds
         )
-        aggregated_bars.append(bar)
+        aggregated = OHLCVArray(times, opens, highs, lows, closes, volumes)
+        logger.info(f"Aggregated {len(arr)} 1m bars to {len(aggregated)} {target_timeframe} bars using bucket kernel")
+        return aggregated
 
-    logger.info(f"Aggregated {len(bars_1m)} 1m bars to {len(aggregated_bars)} {target_timeframe} bars using time-based grouping")
-    return aggregated_bars
+    # No-numba fallback: same wall-clock buckets, reduced per run with
+    # reduceat - bars are chronological, so each bucket is a contiguous run
+    buckets = (arr.times // period_seconds).astype(np.int64)
+    aggregated = _reduce_group_runs(arr, buckets)
+    aggregated.times = _align_times_to_boundary(aggregated.times, target_timeframe)
 
+    logger.info(f"Aggregated {len(arr)} 1m bars to {len(aggregated)} {target_timeframe} bars using bucketed reduceat")
+    return aggregated
 
-def _aggregate_to_daily(bars_1m: List[OHLCV]) -> List[OHLCV]:
+
+def _align_times_to_boundary(times: np.ndarray, timeframe: str) -> np.ndarray:
+    """
+    Vectorized timestamp alignment to timeframe boundaries.
+
+    Floors each timestamp to the start of its period via integer division —
+    the array equivalent of _align_historical_to_boundary for fixed-width
+    intraday periods.
+    """
+    seconds = TimeframeAggregator.TIMEFRAMES[timeframe][1]
+    return (np.asarray(times, dtype=np.float64) // seconds) * seconds
+
+
+def _reduce_group_runs(arr: OHLCVArray, group_ids: np.ndarray) -> OHLCVArray:
+    """
+    Aggregate consecutive runs of equal group ids with ufunc.reduceat.
+
+    Bars are chronological, so each group (day, week, ...) is a contiguous
+    run; boundaries fall where the id changes. np.maximum/minimum/add
+    .reduceat then produce every group's high/low/volume in one C pass
+    each, with opens/closes/times gathered at the run endpoints.
+    """
+    starts = np.concatenate(([0], np.where(np.diff(group_ids) != 0)[0] + 1))
+    ends = np.r_[starts[1:] - 1, len(group_ids) - 1]
+
+    return OHLCVArray(
+        times=arr.times[starts],
+        opens=arr.opens[starts],
+        highs=np.maximum.reduceat(np.ascontiguousarray(arr.highs), starts),
+        lows=np.minimum.reduceat(np.ascontiguousarray(arr.lows), starts),
+        closes=arr.closes[ends],
+        volumes=np.add.reduceat(np.ascontiguousarray(arr.volumes), starts)
+    )
+
+
+def _aggregate_to_daily(bars_1m: Union[List[OHLCV], OHLCVArray]) -> OHLCVArray:
     """
     Aggregate 1m bars to daily bars.
-    Groups bars by trading day (6.5 hour session).
+
+    Day buckets come from integer division (ts // 86400); the per-day
+    reductions run as single reduceat passes over the SoA arrays.
     """
-    # Group by date
-    daily_groups = {}
-
-    for bar in bars_1m:
-        date = datetime.fromtimestamp(bar.time).date()
-        if date not in daily_groups:
-            daily_groups[date] = []
-        daily_groups[date].append(bar)
-
-    # Aggregate each day's bars
-    daily_bars = []
-    for date, bars in sorted(daily_groups.items()):
-        bar = OHLCV(
-            time=bars[0].time,
-            open=bars[0].open,
-            high=max(b.high for b in bars),
-            low=min(b.low for b in bars),
-            close=bars[-1].close,
-            volume=sum(b.volume for b in bars)
-        )
-        daily_bars.append(bar)
+    if len(bars_1m) == 0:
+        return OHLCVArray.from_bars([])
 
-    return daily_bars
+    arr = bars_1m if isinstance(bars_1m, OHLCVArray) else OHLCVArray.from_bars(bars_1m)
+    buckets = (arr.times // 86400).astype(np.int64)
+    return _reduce_group_runs(arr, buckets)
 
 
-def _aggregate_to_weekly(daily_bars: List[OHLCV]) -> List[OHLCV]:
+def _aggregate_to_weekly(daily_bars: Union[List[OHLCV], OHLCVArray]) -> OHLCVArray:
     """
     Aggregate daily bars to weekly bars.
-    Groups bars by week (5 trading days).
+
+    Groups by ISO calendar (year, week) - same keys as the old per-bar
+    isocalendar() loop, computed once over the whole index, then reduced
+    per week with reduceat.
     """
-    # Group by week (Monday = 0, Sunday = 6)
-    weekly_groups = {}
-
-    for bar in daily_bars:
-        date = datetime.fromtimestamp(bar.time)
-        # Get week number
-        week_key = (date.year, date.isocalendar()[1])
-
-        if week_key not in weekly_groups:
-            weekly_groups[week_key] = []
-        weekly_groups[week_key].append(bar)
-
-    # Aggregate each week's bars
-    weekly_bars = []
-    for week_key, bars in sorted(weekly_groups.items()):
-        bar = OHLCV(
-            time=bars[0].time,
-            open=bars[0].open,
-            high=max(b.high for b in bars),
-            low=min(b.low for b in bars),
-            close=bars[-1].close,
-            volume=sum(b.volume for b in bars)
-        )
-        weekly_bars.append(bar)
+    if len(daily_bars) == 0:
+        return OHLCVArray.from_bars([])
 
-    return weekly_bars
+    arr = daily_bars if isinstance(daily_bars, OHLCVArray) else OHLCVArray.from_bars(daily_bars)
+    iso = pd.to_datetime(arr.times, unit="s").isocalendar()
+    week_ids = iso.year.to_numpy().astype(np.int64) * 100 + iso.week.to_numpy().astype(np.int64)
+    return _reduce_group_runs(arr, week_ids)
@@ -4,19 +4,32 @@ Data Cache Module
 Purpose: In-memory caching layer for historical OHLCV data and aggregated bars.
 Thread-safe implementation for FastAPI async operations.
 
-Cache Structure: {(symbol, timeframe): [OHLCV bars]}
+Cache Structure: {(symbol, timeframe): OHLCVArray}
 """
 
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
+import threading
 from threading import Lock
 from datetime import datetime
 import logging
 
+import numpy as np
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
 class OHLCV:
-    """OHLCV bar data model"""
+    """
+    OHLCV bar data model.
+
+    __slots__ keeps instances to a fixed C array of six references instead
+    of a per-object __dict__ - roughly 3x less memory per bar and faster
+    attribute access in the aggregation loops, which matters at up to
+    20,000 bars per symbol and timeframe.
+    """
+
+    __slots__ = ("time", "open", "high", "low", "close", "volume")
 
     def __init__(self, time: float, open: float, high: float, low: float, close: float, volume: float):
         self.time = time
@@ -53,65 +66,416 @@ class OHLCV:
         return f"OHLCV(t={datetime.fromtimestamp(self.time).isoformat()}, O={self.open}, H={self.high}, L={self.low}, C={self.close}, V={self.volume})"
 
 
+class OHLCVArray:
+    """
+    Struct-of-Arrays container for OHLCV bars.
+
+    Stores bars as six parallel np.float64 arrays (time/open/high/low/close/volume)
+    instead of a list of OHLCV objects. Aggregation becomes C-level vectorized
+    reductions (highs[i:j].max(), lows[i:j].min(), vols[i:j].sum()) over
+    contiguous memory instead of per-bar Python attribute lookups.
+
+    Behaves like a sequence of OHLCV bars for compatibility:
+    - len(arr), arr[i] (returns OHLCV), arr[i:j] (returns OHLCVArray view), iteration
+    """
+
+    def __init__(
+        self,
+        times: np.ndarray,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray
+    ):
+        self.times = np.asarray(times, dtype=np.float64)
+        self.opens = np.asarray(opens, dtype=np.float64)
+        self.highs = np.asarray(highs, dtype=np.float64)
+        self.lows = np.asarray(lows, dtype=np.float64)
+        self.closes = np.asarray(closes, dtype=np.float64)
+        self.volumes = np.asarray(volumes, dtype=np.float64)
+
+    @classmethod
+    def from_bars(cls, bars: List[OHLCV]) -> "OHLCVArray":
+        """Build SoA arrays from a list of OHLCV objects (single pass)."""
+        n = len(bars)
+        times = np.empty(n, dtype=np.float64)
+        opens = np.empty(n, dtype=np.float64)
+        highs = np.empty(n, dtype=np.float64)
+        lows = np.empty(n, dtype=np.float64)
+        closes = np.empty(n, dtype=np.float64)
+        volumes = np.empty(n, dtype=np.float64)
+
+        for i, bar in enumerate(bars):
+            times[i] = bar.time
+            opens[i] = bar.open
+            highs[i] = bar.high
+            lows[i] = bar.low
+            closes[i] = bar.close
+            volumes[i] = bar.volume
+
+        return cls(times, opens, highs, lows, closes, volumes)
+
+    def to_list(self) -> List[OHLCV]:
+        """Materialize as a list of OHLCV objects (for legacy callers)."""
+        return [self[i] for i in range(len(self))]
+
+    def to_dicts(self) -> List[dict]:
+        """
+        Convert to a list of bar dicts for JSON serialization.
+
+        Uses bulk .tolist() conversion + zip instead of per-bar OHLCV
+        object construction and to_dict() calls.
+        """
+        return [
+            {"time": t, "open": o, "high": h, "low": l, "close": c, "volume": v}
+            for t, o, h, l, c, v in zip(
+                self.times.tolist(),
+                self.opens.tolist(),
+                self.highs.tolist(),
+                self.lows.tolist(),
+                self.closes.tolist(),
+                self.volumes.tolist()
+            )
+        ]
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize all bars to a JSON array of bar objects (orjson bytes).
+
+        orjson serializes the whole array in C - roughly 5-10x faster than
+        per-bar to_dict() + stdlib json on large histories.
+        """
+        return orjson.dumps(self.to_dicts())
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[OHLCV, "OHLCVArray"]:
+        if isinstance(index, slice):
+            # Slices return zero-copy views over the underlying arrays
+            return OHLCVArray(
+                self.times[index],
+                self.opens[index],
+                self.highs[index],
+                self.lows[index],
+                self.closes[index],
+                self.volumes[index]
+            )
+
+        return OHLCV(
+            time=float(self.times[index]),
+            open=float(self.opens[index]),
+            high=float(self.highs[index]),
+            low=float(self.lows[index]),
+            close=float(self.closes[index]),
+            volume=float(self.volumes[index])
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"OHLCVArray({len(self)} bars)"
+
+
+class _SeriesBuffer:
+    """
+    Growable SoA backing store for an appendable cached series.
+
+    Six preallocated float64 columns with spare capacity; the published
+    OHLCVArray is a zero-copy view of the first `length` slots. Appends
+    write into the spare tail, so lock-free readers holding an earlier view
+    never observe the new slot. When the buffer fills, columns are
+    reallocated (doubling, capped near MAX_BARS retention) and readers keep
+    the abandoned arrays - nothing they can see is ever overwritten.
+    """
+
+    __slots__ = ("times", "opens", "highs", "lows", "closes", "volumes", "length")
+
+    MIN_CAPACITY = 64
+
+    def __init__(self, capacity: int):
+        self.times = np.empty(capacity, dtype=np.float64)
+        self.opens = np.empty(capacity, dtype=np.float64)
+        self.highs = np.empty(capacity, dtype=np.float64)
+        self.lows = np.empty(capacity, dtype=np.float64)
+        self.closes = np.empty(capacity, dtype=np.float64)
+        self.volumes = np.empty(capacity, dtype=np.float64)
+        self.length = 0
+
+    @classmethod
+    def from_array(cls, arr: OHLCVArray) -> "_SeriesBuffer":
+        """Seed a buffer from an existing series, reserving growth room."""
+        n = len(arr)
+        buf = cls(max(2 * n, cls.MIN_CAPACITY))
+        buf.times[:n] = arr.times
+        buf.opens[:n] = arr.opens
+        buf.highs[:n] = arr.highs
+        buf.lows[:n] = arr.lows
+        buf.closes[:n] = arr.closes
+        buf.volumes[:n] = arr.volumes
+        buf.length = n
+        return buf
+
+    @property
+    def capacity(self) -> int:
+        return len(self.times)
+
+    def view(self) -> OHLCVArray:
+        """Zero-copy OHLCVArray over the filled slots."""
+        n = self.length
+        return OHLCVArray(
+            self.times[:n], self.opens[:n], self.highs[:n],
+            self.lows[:n], self.closes[:n], self.volumes[:n]
+        )
+
+    def _reallocate(self, max_bars: int) -> None:
+        """Move the retained tail into fresh, larger columns."""
+        # Slack beyond the retention bound keeps trims amortized: a full
+        # buffer at the cap drops down to max_bars, so the O(n) copy
+        # happens at most once per max_bars // 4 appends
+        cap_limit = max_bars + max_bars // 4
+        if self.capacity < cap_limit:
+            new_cap = min(max(2 * self.capacity, self.MIN_CAPACITY), cap_limit)
+            keep = self.length
+        else:
+            new_cap = cap_limit
+            keep = max_bars
+
+        start = self.length - keep
+        for col in self.__slots__[:-1]:
+            old = getattr(self, col)
+            new = np.empty(new_cap, dtype=np.float64)
+            new[:keep] = old[start:self.length]
+            setattr(self, col, new)
+        self.length = keep
+
+    def append(self, bar: OHLCV, max_bars: int) -> None:
+        """Append one bar, growing/trimming the backing columns as needed."""
+        if self.length == self.capacity:
+            self._reallocate(max_bars)
+
+        i = self.length
+        self.times[i] = bar.time
+        self.opens[i] = bar.open
+        self.highs[i] = bar.high
+        self.lows[i] = bar.low
+        self.closes[i] = bar.close
+        self.volumes[i] = bar.volume
+        self.length = i + 1
+
+
 class DataCache:
     """
     Thread-safe in-memory cache for historical and aggregated OHLCV data.
 
     Features:
     - Cache key: (symbol, timeframe) tuple
-    - Thread-safe operations with locks
+    - Copy-on-write dict: readers are lock-free, writers swap a new dict
     - Cache hit/miss tracking
     - Automatic timestamp tracking
-    """
 
-    def __init__(self):
-        """Initialize empty cache with lock for thread safety"""
-        self._cache: Dict[Tuple[str, str], List[OHLCV]] = {}
-        self._lock = Lock()
-        self._cache_hits = 0
-        self._cache_misses = 0
+    Concurrency model: the cache dict is treated as immutable once
+    published. Writers build a modified copy under the write lock and
+    atomically swap the reference; readers dereference `self._cache` once
+    (atomic in CPython) and never observe a partially updated dict.
+
+    Size bound: at most `maxsize` keys are retained. When a set() would
+    exceed the bound, the least-recently-used key is evicted. Recency is
+    tracked with a monotonically increasing use counter updated lock-free
+    on each hit (a rare lost update only slightly perturbs eviction order).
+    """
 
-    def get(self, symbol: str, timeframe: str) -> Optional[List[OHLCV]]:
+    DEFAULT_MAXSIZE = 256
+
+    # Per-series retention bound for the append path (matches the API's
+    # 20,000-bar request cap - nothing ever reads further back)
+    MAX_BARS = 20000
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """Initialize empty cache with a write lock (readers are lock-free)"""
+        self._cache: Dict[Tuple[str, str], OHLCVArray] = {}
+        # Capacity-backed buffers for appendable series (write-lock only)
+        self._buffers: Dict[Tuple[str, str], _SeriesBuffer] = {}
+        # Pre-serialized JSON bar arrays, produced once at set() time so the
+        # read-heavy HIT path can return bytes without re-serializing
+        self._payloads: Dict[Tuple[str, str], bytes] = {}
+        self._maxsize = maxsize
+        self._last_used: Dict[Tuple[str, str], int] = {}
+        self._use_counter = 0
+        self._write_lock = Lock()
+
+        # Hit/miss counters are accumulated per thread and merged on demand
+        # in get_stats() - reads never touch shared counter state
+        self._stats_local = threading.local()
+        self._stats_registry: List[Dict[str, int]] = []
+        self._stats_registry_lock = Lock()
+
+    def _thread_counters(self) -> Dict[str, int]:
+        """Get this thread's stats accumulator, registering it on first use."""
+        counters = getattr(self._stats_local, "counters", None)
+        if counters is None:
+            counters = {"hits": 0, "misses": 0}
+            self._stats_local.counters = counters
+            with self._stats_registry_lock:
+                self._stats_registry.append(counters)
+        return counters
+
+    def get(self, symbol: str, timeframe: str) -> Optional[OHLCVArray]:
         """
-        Retrieve cached data for symbol and timeframe.
+        Retrieve cached data for symbol and timeframe (lock-free).
 
         Args:
             symbol: Trading symbol (e.g., "CME_MINI:MNQ1!")
             timeframe: Timeframe string (e.g., "1m", "5m", "1H", "1D")
 
         Returns:
-            List of OHLCV bars if cached, None otherwise
+            OHLCVArray of bars if cached, None otherwise
         """
+        # Snapshot the current dict reference - no lock needed
         key = (symbol, timeframe)
+        cache = self._cache
+        bars = cache.get(key)
+
+        counters = self._thread_counters()
+        if bars is not None:
+            counters["hits"] += 1
+            # Lock-free recency bump for LRU eviction
+            self._use_counter += 1
+            self._last_used[key] = self._use_counter
+            logger.debug(f"Cache HIT: {symbol} {timeframe}")
+        else:
+            counters["misses"] += 1
+            logger.debug(f"Cache MISS: {symbol} {timeframe}")
+
+        return bars
+
+    def set(self, symbol: str, timeframe: str, bars: Union[List[OHLCV], OHLCVArray]) -> None:
+        """
+        Store data in cache (copy-on-write swap).
 
-        with self._lock:
-            if key in self._cache:
-                self._cache_hits += 1
-                logger.debug(f"Cache HIT: {symbol} {timeframe}")
-                return self._cache[key]
-            else:
-                self._cache_misses += 1
-                logger.debug(f"Cache MISS: {symbol} {timeframe}")
-                return None
+        Bars are normalized to columnar OHLCVArray storage: 48 packed bytes
+        per bar instead of a Python object with six boxed floats, and every
+        later slice/aggregation runs over contiguous arrays.
 
-    def set(self, symbol: str, timeframe: str, bars: List[OHLCV]) -> None:
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe string
+            bars: Bars to cache (list of OHLCV or OHLCVArray)
+        """
+        key = (symbol, timeframe)
+
+        # Normalize to SoA storage, then serialize once outside the lock -
+        # every subsequent hit reuses the payload bytes
+        if not isinstance(bars, OHLCVArray):
+            bars = OHLCVArray.from_bars(bars)
+        payload = bars.to_json_bytes()
+
+        with self._write_lock:
+            new_cache = dict(self._cache)
+            new_cache[key] = bars
+            new_payloads = dict(self._payloads)
+            new_payloads[key] = payload
+            # The replaced series orphans any append buffer for this key
+            self._buffers.pop(key, None)
+
+            self._use_counter += 1
+            self._last_used[key] = self._use_counter
+
+            # Evict least-recently-used keys while over the size bound
+            while len(new_cache) > self._maxsize:
+                evict_key = min(new_cache, key=lambda k: self._last_used.get(k, 0))
+                del new_cache[evict_key]
+                new_payloads.pop(evict_key, None)
+                self._buffers.pop(evict_key, None)
+                self._last_used.pop(evict_key, None)
+                logger.info(f"Evicted LRU cache entry: {evict_key}")
+
+            self._cache = new_cache
+            self._payloads = new_payloads
+            logger.info(f"Cached {len(bars)} bars for {symbol} {timeframe}")
+
+    def append(self, symbol: str, timeframe: str, bar: OHLCV) -> None:
         """
-        Store data in cache.
+        Append one bar to a cached series in amortized O(1).
+
+        The series is backed by a capacity-reserved _SeriesBuffer: most
+        appends are a single row write plus a view republish, with no copy
+        of the existing bars. Retention is bounded at MAX_BARS; the
+        pre-serialized payload is dropped, so hits fall back to per-request
+        serialization until the next set() rebuilds it.
+
+        Forward-looking API: the live pipeline still serves bars from the
+        aggregator and refreshes the cache wholesale via set(); nothing
+        calls append yet.
 
         Args:
             symbol: Trading symbol
             timeframe: Timeframe string
-            bars: List of OHLCV bars to cache
+            bar: Bar to append
         """
         key = (symbol, timeframe)
 
-        with self._lock:
-            self._cache[key] = bars
-            logger.info(f"Cached {len(bars)} bars for {symbol} {timeframe}")
+        with self._write_lock:
+            buf = self._buffers.get(key)
+            if buf is None:
+                existing = self._cache.get(key)
+                if existing is None:
+                    existing = OHLCVArray.from_bars([])
+                buf = _SeriesBuffer.from_array(existing)
+                self._buffers[key] = buf
+
+            buf.append(bar, self.MAX_BARS)
+
+            new_cache = dict(self._cache)
+            new_cache[key] = buf.view()
+            new_payloads = dict(self._payloads)
+            new_payloads.pop(key, None)
+
+            self._use_counter += 1
+            self._last_used[key] = self._use_counter
+
+            self._cache = new_cache
+            self._payloads = new_payloads
+
+    def get_payload(self, symbol: str, timeframe: str) -> Optional[bytes]:
+        """
+        Retrieve the pre-serialized JSON bar array for a cached key (lock-free).
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe string
+
+        Returns:
+            orjson-encoded JSON array of bars if cached, None otherwise
+        """
+        return self._payloads.get((symbol, timeframe))
+
+    def invalidate_payload(self, symbol: str, timeframe: str) -> None:
+        """
+        Drop the pre-serialized payload for a key; the bars stay cached.
+
+        Called when live aggregation updates a timeframe, so a later history
+        request re-serializes current data instead of replaying stale bytes.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe string
+        """
+        key = (symbol, timeframe)
+        if key not in self._payloads:
+            return
+
+        with self._write_lock:
+            new_payloads = dict(self._payloads)
+            new_payloads.pop(key, None)
+            self._payloads = new_payloads
 
     def has(self, symbol: str, timeframe: str) -> bool:
         """
-        Check if data is cached.
+        Check if data is cached (lock-free).
 
         Args:
             symbol: Trading symbol
@@ -120,14 +484,15 @@ class DataCache:
         Returns:
             True if cached, False otherwise
         """
-        key = (symbol, timeframe)
-        with self._lock:
-            return key in self._cache
+        return (symbol, timeframe) in self._cache
 
     def clear(self) -> None:
         """Clear all cached data"""
-        with self._lock:
-            self._cache.clear()
+        with self._write_lock:
+            self._cache = {}
+            self._payloads = {}
+            self._buffers = {}
+            self._last_used = {}
             logger.warning("Cache cleared")
 
     def get_stats(self) -> dict:
@@ -137,26 +502,28 @@ class DataCache:
         Returns:
             Dictionary with cache stats (hits, misses, total_keys, hit_rate)
         """
-        with self._lock:
-            total_requests = self._cache_hits + self._cache_misses
-            hit_rate = (self._cache_hits / total_requests * 100) if total_requests > 0 else 0
+        with self._stats_registry_lock:
+            hits = sum(c["hits"] for c in self._stats_registry)
+            misses = sum(c["misses"] for c in self._stats_registry)
+
+        total_requests = hits + misses
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
 
-            return {
-                "cache_hits": self._cache_hits,
-                "cache_misses": self._cache_misses,
-                "total_keys": len(self._cache),
-                "hit_rate_percent": round(hit_rate, 2)
-            }
+        return {
+            "cache_hits": hits,
+            "cache_misses": misses,
+            "total_keys": len(self._cache),
+            "hit_rate_percent": round(hit_rate, 2)
+        }
 
     def list_cached_symbols(self) -> List[Tuple[str, str]]:
         """
-        List all cached (symbol, timeframe) pairs.
+        List all cached (symbol, timeframe) pairs (lock-free snapshot).
 
         Returns:
             List of cached keys
         """
-        with self._lock:
-            return list(self._cache.keys())
+        return list(self._cache.keys())
 
 
 # Global cache instance
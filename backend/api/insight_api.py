@@ -12,12 +12,15 @@ Tested & Working (from PLAN.md):
 
 import os
 import logging
-import requests
-from typing import List, Optional
+from typing import Optional
 import time
 from datetime import datetime
 
-from .cache import OHLCV, get_cache
+import httpx
+import numpy as np
+import orjson
+
+from .cache import OHLCVArray, get_cache
 from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
@@ -53,14 +56,28 @@ class InsightSentryAPI:
         self.api_key = api_key
         self.cache = get_cache()
         self.rate_limiter = RateLimiter(rate_limit=25, period=60)  # 25 requests/minute (Pro plan)
+
+        # Persistent async client: TCP + TLS handshakes are amortized across
+        # requests via keep-alive pooling, and awaited I/O never blocks the
+        # FastAPI event loop the way requests.get did
+        self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=30
+        )
+
         logger.info("Initialized InsightSentryAPI client")
 
-    def fetch_historical_data(
+    async def close(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+    async def fetch_historical_data(
         self,
         symbol: str,
         timeframe: str,
         bars: int = 1000
-    ) -> List[OHLCV]:
+    ) -> OHLCVArray:
         """
         Fetch historical OHLCV data for symbol and timeframe.
 
@@ -75,11 +92,11 @@ class InsightSentryAPI:
             bars: Number of bars to fetch (max 20,000 for Pro plan)
 
         Returns:
-            List of OHLCV bars
+            OHLCVArray of bars
 
         Raises:
             ValueError: Invalid timeframe
-            requests.HTTPError: API request failed
+            httpx.HTTPError: API request failed
         """
         if timeframe not in self.TIMEFRAME_MAP:
             raise ValueError(f"Invalid timeframe: {timeframe}")
@@ -93,31 +110,27 @@ class InsightSentryAPI:
         # Cache miss - fetch from API
         logger.info(f"Cache miss for {symbol} {timeframe}, fetching from API")
 
-        # Respect rate limit
-        self.rate_limiter.wait_if_needed()
+        # Respect rate limit (yields to the event loop while waiting)
+        await self.rate_limiter.async_wait()
 
         # Convert timeframe to API parameters
         bar_type, bar_interval = self.TIMEFRAME_MAP[timeframe]
 
         # Build request
-        url = f"{self.BASE_URL}/v3/symbols/{symbol}/series"
+        url = f"/v3/symbols/{symbol}/series"
         params = {
             "bar_type": bar_type,
             "bar_interval": bar_interval,
             "data_points": bars,
             "extended": True
         }
-        headers = {
-            "Authorization": f"Bearer {self.api_key}"
-        }
-
         try:
-            # Make request
+            # Make request (pooled client carries the auth header)
             logger.debug(f"Requesting: {url} with params {params}")
-            response = requests.get(url, params=params, headers=headers, timeout=30)
+            response = await self._client.get(url, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info(f"Received response from API: {len(data.get('series', []))} bars")
 
             # Parse response
@@ -128,25 +141,28 @@ class InsightSentryAPI:
 
             return ohlcv_bars
 
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching data: {e}")
             raise
-        except requests.exceptions.RequestException as e:
+        except httpx.RequestError as e:
             logger.error(f"Request error: {e}")
             raise
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
             raise
 
-    def _parse_response(self, data: dict) -> List[OHLCV]:
+    def _parse_response(self, data: dict) -> OHLCVArray:
         """
-        Parse API response into OHLCV objects.
+        Parse API response into SoA OHLCV arrays.
+
+        Builds six typed NumPy arrays directly with np.fromiter instead of
+        allocating one Python OHLCV object per bar (up to 20,000 per load).
 
         Args:
             data: Response JSON from API
 
         Returns:
-            List of OHLCV bars
+            OHLCVArray of bars
 
         Expected format:
         {
@@ -167,21 +183,19 @@ class InsightSentryAPI:
         if "series" not in data:
             raise ValueError(f"Invalid response format: 'series' key missing")
 
-        bars = []
-        for bar_data in data["series"]:
-            bar = OHLCV(
-                time=bar_data["time"],
-                open=bar_data["open"],
-                high=bar_data["high"],
-                low=bar_data["low"],
-                close=bar_data["close"],
-                volume=bar_data["volume"]
-            )
-            bars.append(bar)
-
-        return bars
-
-    def fetch_real_time_quote(self, symbol: str) -> dict:
+        series = data["series"]
+        n = len(series)
+
+        return OHLCVArray(
+            times=np.fromiter((b["time"] for b in series), dtype=np.float64, count=n),
+            opens=np.fromiter((b["open"] for b in series), dtype=np.float64, count=n),
+            highs=np.fromiter((b["high"] for b in series), dtype=np.float64, count=n),
+            lows=np.fromiter((b["low"] for b in series), dtype=np.float64, count=n),
+            closes=np.fromiter((b["close"] for b in series), dtype=np.float64, count=n),
+            volumes=np.fromiter((b["volume"] for b in series), dtype=np.float64, count=n)
+        )
+
+    async def fetch_real_time_quote(self, symbol: str) -> dict:
         """
         Fetch real-time quote data for a symbol.
 
@@ -192,31 +206,29 @@ class InsightSentryAPI:
             Quote data dictionary
 
         Raises:
-            requests.HTTPError: API request failed
+            httpx.HTTPError: API request failed
         """
         logger.debug(f"Fetching real-time quote for {symbol}")
 
         # Respect rate limit
-        self.rate_limiter.wait_if_needed()
+        await self.rate_limiter.async_wait()
 
-        url = f"{self.BASE_URL}/v3/symbols/quotes"
         params = {"codes": symbol}
-        headers = {"Authorization": f"Bearer {self.api_key}"}
 
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=30)
+            response = await self._client.get("/v3/symbols/quotes", params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.debug(f"Received quote data: {data.get('last_update')}")
 
             return data
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error fetching quote: {e}")
             raise
 
-    def get_symbol_info(self, symbol: str) -> dict:
+    async def get_symbol_info(self, symbol: str) -> dict:
         """
         Fetch detailed symbol information.
 
@@ -227,26 +239,23 @@ class InsightSentryAPI:
             Symbol information dictionary
 
         Raises:
-            requests.HTTPError: API request failed
+            httpx.HTTPError: API request failed
         """
         logger.debug(f"Fetching symbol info for {symbol}")
 
         # Respect rate limit
-        self.rate_limiter.wait_if_needed()
-
-        url = f"{self.BASE_URL}/v3/symbols/{symbol}/info"
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+        await self.rate_limiter.async_wait()
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = await self._client.get(f"/v3/symbols/{symbol}/info")
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.debug(f"Received symbol info: {data.get('name')}")
 
             return data
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error fetching symbol info: {e}")
             raise
 
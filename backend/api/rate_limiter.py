@@ -9,6 +9,7 @@ From PLAN.md:
 - Token bucket algorithm with burst allowance and gradual refill
 """
 
+import asyncio
 import time
 import threading
 import logging
@@ -38,47 +39,71 @@ class RateLimiter:
         self.rate_limit = rate_limit  # requests
         self.period = period  # seconds
         self.tokens = rate_limit  # Start with full bucket
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self._lock = threading.Lock()
 
         logger.info(f"Initialized RateLimiter: {rate_limit} requests per {period} seconds")
 
+    def _refill(self) -> None:
+        """Refill tokens based on elapsed monotonic time. Caller holds the lock."""
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        tokens_to_add = elapsed * (self.rate_limit / self.period)
+
+        self.tokens = min(self.rate_limit, self.tokens + tokens_to_add)
+        self.last_update = now
+
     def wait_if_needed(self) -> None:
         """
         Wait if rate limit would be exceeded.
         Blocks until a token is available.
 
-        This method implements the token bucket algorithm:
-        1. Calculate time passed since last update
-        2. Refill tokens based on elapsed time
-        3. If no tokens available, wait for refill
-        4. Consume one token
+        Token bucket algorithm with the sleep performed OUTSIDE the lock:
+        1. Under the lock: refill tokens from elapsed monotonic time
+        2. If a token is available, consume it and return
+        3. Otherwise compute the deficit wait time, release the lock, sleep
+        4. Loop and retry - concurrent callers wait in parallel instead of
+           serializing on a mutex held across the sleep
+
+        Uses time.monotonic so NTP wall-clock steps cannot stall or burst
+        the bucket.
         """
-        with self._lock:
-            now = time.time()
+        while True:
+            with self._lock:
+                self._refill()
 
-            # Calculate elapsed time and refill tokens
-            elapsed = now - self.last_update
-            tokens_to_add = elapsed * (self.rate_limit / self.period)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    logger.debug(f"Token consumed. Remaining tokens: {self.tokens:.2f}")
+                    return
 
-            self.tokens = min(self.rate_limit, self.tokens + tokens_to_add)
-            self.last_update = now
+                # Time until one full token has accumulated
+                wait_time = (1.0 - self.tokens) * (self.period / self.rate_limit)
 
-            # Wait if no tokens available
-            if self.tokens < 1:
-                # Calculate how long to wait for one token
-                wait_time = (1.0 / self.rate_limit) * self.period
-                logger.debug(f"Rate limit reached, waiting {wait_time:.2f} seconds")
-                time.sleep(wait_time)
+            # Sleep without holding the lock, then re-check
+            logger.debug(f"Rate limit reached, waiting {wait_time:.2f} seconds")
+            time.sleep(wait_time)
 
-                # Refill after waiting
-                self.tokens = self.rate_limit
-                self.last_update = time.time()
+    async def async_wait(self) -> None:
+        """
+        Async variant of wait_if_needed for use on the event loop.
 
-            # Consume one token
-            self.tokens -= 1
+        Identical token-bucket logic, but waits with asyncio.sleep so other
+        coroutines keep running instead of blocking the loop thread.
+        """
+        while True:
+            with self._lock:
+                self._refill()
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    logger.debug(f"Token consumed. Remaining tokens: {self.tokens:.2f}")
+                    return
 
-            logger.debug(f"Token consumed. Remaining tokens: {self.tokens:.2f}")
+                wait_time = (1.0 - self.tokens) * (self.period / self.rate_limit)
+
+            logger.debug(f"Rate limit reached, waiting {wait_time:.2f} seconds")
+            await asyncio.sleep(wait_time)
 
     def get_available_tokens(self) -> float:
         """
@@ -88,17 +113,12 @@ class RateLimiter:
             Number of available tokens
         """
         with self._lock:
-            # Update tokens based on elapsed time
-            now = time.time()
-            elapsed = now - self.last_update
-            tokens_to_add = elapsed * (self.rate_limit / self.period)
-
-            available = min(self.rate_limit, self.tokens + tokens_to_add)
-            return available
+            self._refill()
+            return self.tokens
 
     def reset(self) -> None:
         """Reset rate limiter to full capacity."""
         with self._lock:
             self.tokens = self.rate_limit
-            self.last_update = time.time()
+            self.last_update = time.monotonic()
             logger.warning("RateLimiter reset to full capacity")
@@ -13,13 +13,17 @@ From PLAN.md (Tested & Working):
 """
 
 import asyncio
+import random
 import websockets
-import json
+import websockets.exceptions
 import logging
+
+import numpy as np
+import orjson
 from typing import Callable, Optional, Set
 from datetime import datetime
 
-from .cache import OHLCV, get_cache
+from .cache import OHLCV, OHLCVArray, get_cache
 from .aggregator import TimeframeAggregator, aggregate_historical_1m_to_timeframe
 
 logger = logging.getLogger(__name__)
@@ -33,11 +37,19 @@ class InsightSentryWebSocketClient:
     - Auto-reconnection with exponential backoff
     - Aggregates 1m bars to all 9 timeframes
     - Broadcasts updates to connected frontend clients
-    - Heartbeat/ping for connection health
+    - Protocol-level ping/pong keepalive (managed by the websockets library)
     """
 
     WS_URL = "wss://realtime.insightsentry.com/live"
 
+    # Coalesced update batches buffered between ingest and fan-out; oldest
+    # batches are dropped first when the broadcaster falls behind
+    OUTBOUND_QUEUE_SIZE = 64
+
+    # Batches above this size aggregate in a worker thread so the event
+    # loop keeps servicing pings and frames during historical backfill
+    BURST_THRESHOLD = 20
+
     def __init__(self, api_key: str, symbol: str = "CME_MINI:MNQ1!"):
         """
         Initialize WebSocket client.
@@ -49,16 +61,29 @@ class InsightSentryWebSocketClient:
         self.api_key = api_key
         self.symbol = symbol
         self.aggregator = TimeframeAggregator()
-        self.websocket: Optional[websockets.WebSocketClientProtocol] = None
+        self.websocket: Optional[websockets.ClientConnection] = None
         self.is_connected = False
 
         # Callbacks for broadcasting to frontend clients
-        self.on_bar_update: Optional[Callable[[str, list[OHLCV]], None]] = None
+        self.on_bar_update: Optional[Callable[[dict[str, list[OHLCV]]], None]] = None
 
-        # Reconnection settings
-        self.max_reconnect_attempts = 5
-        self.base_reconnect_delay = 1  # seconds
+        # Reconnection settings: retries are unlimited (a market-data feed
+        # must survive upstream flaps), with capped jittered backoff
+        self.base_reconnect_delay = 1   # seconds
+        self.max_reconnect_delay = 60   # seconds
         self.reconnect_attempts = 0
+        self._closing = False
+
+        # Pre-encoded subscription frame: api_key and symbol rarely change,
+        # so reconnects resend the same bytes with zero serialization work
+        self._sub_frame: bytes = self._build_sub_frame(symbol)
+        self._sub_frame_symbol = symbol
+
+        # Bounded hand-off between the ingest loop and the broadcast worker:
+        # _process_bars never awaits frontend sends, so a slow fan-out can
+        # never stall reading the next WS frame
+        self._outbound: asyncio.Queue = asyncio.Queue(maxsize=self.OUTBOUND_QUEUE_SIZE)
+        self._broadcast_task: Optional[asyncio.Task] = None
 
         logger.info(f"Initialized WebSocket client for {symbol}")
 
@@ -71,54 +96,84 @@ class InsightSentryWebSocketClient:
         - Status messages
         - Real-time bar updates
         - Aggregation to all timeframes
-        - Auto-reconnection on disconnect
+        - Auto-reconnection on disconnect (unlimited, jittered backoff)
         """
-        while self.reconnect_attempts < self.max_reconnect_attempts:
+        # One broadcast worker for the client's lifetime, across reconnects
+        if self._broadcast_task is None:
+            self._broadcast_task = asyncio.create_task(self._broadcast_worker())
+
+        while not self._closing:
             try:
                 logger.info(f"Connecting to {self.WS_URL} (attempt {self.reconnect_attempts + 1})...")
 
-                self.websocket = await websockets.connect(self.WS_URL)
+                # compression=None skips permessage-deflate negotiation -
+                # the pure-Python deflate costs more CPU per frame than the
+                # bytes it saves on a fast link. Keepalive uses the library's
+                # protocol-level ping/pong frames (no app-level heartbeat).
+                self.websocket = await websockets.connect(
+                    self.WS_URL,
+                    compression=None,
+                    max_size=2 ** 22,
+                    max_queue=256,
+                    ping_interval=20,
+                    ping_timeout=20
+                )
                 self.is_connected = True
-                self.reconnect_attempts = 0  # Reset on successful connection
 
                 # Send subscription
                 await self._subscribe()
 
-                # Start message loop
+                # Start message loop (backoff resets on the first processed
+                # message, not on TCP connect - a handshake that opens and
+                # immediately dies must keep escalating the delay)
                 await self._message_loop()
 
+            except asyncio.CancelledError:
+                raise
             except websockets.exceptions.ConnectionClosed as e:
                 logger.error(f"WebSocket connection closed: {e}")
-                self.is_connected = False
-
-                # Reconnect with exponential backoff
-                self.reconnect_attempts += 1
-                if self.reconnect_attempts < self.max_reconnect_attempts:
-                    delay = self.base_reconnect_delay * (2 ** (self.reconnect_attempts - 1))
-                    logger.info(f"Reconnecting in {delay} seconds...")
-                    await asyncio.sleep(delay)
-
             except Exception as e:
                 logger.error(f"WebSocket error: {e}")
-                self.is_connected = False
+
+            self.is_connected = False
+            if self._closing:
                 break
 
-    async def _subscribe(self, symbol: str = None) -> None:
-        """Send subscription message to WebSocket."""
-        target_symbol = symbol or self.symbol
-        subscription = {
+            # Jittered exponential backoff: capped so a long outage retries
+            # once a minute, randomized so a fleet of clients does not
+            # reconnect in lockstep when the upstream flaps
+            self.reconnect_attempts += 1
+            delay = min(
+                self.max_reconnect_delay,
+                self.base_reconnect_delay * 2 ** min(self.reconnect_attempts, 6)
+            ) * (0.5 + random.random())
+            logger.info(f"Reconnecting in {delay:.1f} seconds...")
+            await asyncio.sleep(delay)
+
+    def _build_sub_frame(self, symbol: str) -> bytes:
+        """Encode the subscription frame for a symbol (orjson bytes)."""
+        return orjson.dumps({
             "api_key": self.api_key,
             "subscriptions": [
                 {
-                    "code": target_symbol,
+                    "code": symbol,
                     "type": "series",
                     "bar_type": "minute",
                     "bar_interval": 1
                 }
             ]
-        }
+        })
+
+    async def _subscribe(self, symbol: str = None) -> None:
+        """Send the pre-encoded subscription frame to the WebSocket."""
+        target_symbol = symbol or self.symbol
 
-        await self.websocket.send(json.dumps(subscription))
+        # Re-encode only on symbol transitions; reconnects reuse the frame
+        if target_symbol != self._sub_frame_symbol:
+            self._sub_frame = self._build_sub_frame(target_symbol)
+            self._sub_frame_symbol = target_symbol
+
+        await self.websocket.send(self._sub_frame)
         logger.info(f"Sent subscription for {target_symbol}")
 
     async def _unsubscribe(self, symbol: str) -> None:
@@ -136,7 +191,7 @@ class InsightSentryWebSocketClient:
             ]
         }
 
-        await self.websocket.send(json.dumps(unsubscription))
+        await self.websocket.send(orjson.dumps(unsubscription))
         logger.info(f"Sent unsubscription for {symbol}")
 
     async def _message_loop(self) -> None:
@@ -148,15 +203,29 @@ class InsightSentryWebSocketClient:
         - Data messages: {"code": "...", "series": [...]}
         - Pong responses: "pong"
         """
-        async for message in self.websocket:
+        while True:
+            # decode=False returns the raw frame payload as bytes, skipping
+            # the per-frame UTF-8 decode + validation of the str path;
+            # orjson parses the bytes directly
             try:
+                message = await self.websocket.recv(decode=False)
+            except websockets.exceptions.ConnectionClosedOK:
+                logger.info("WebSocket closed cleanly")
+                break
+
+            try:
+                # A delivered message proves the link is genuinely healthy -
+                # only now does the reconnect backoff reset
+                if self.reconnect_attempts:
+                    self.reconnect_attempts = 0
+
                 # Handle pong messages
-                if message == "pong":
+                if message == b"pong":
                     logger.debug("Received pong")
                     continue
 
-                # Parse JSON
-                data = json.loads(message)
+                # Parse JSON straight from the frame bytes
+                data = orjson.loads(message)
 
                 # Handle status messages
                 if "message" in data:
@@ -167,7 +236,7 @@ class InsightSentryWebSocketClient:
                 if "series" in data and len(data["series"]) > 0:
                     await self._process_bars(data["series"])
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse message: {e}")
                 continue
             except Exception as e:
@@ -188,42 +257,63 @@ class InsightSentryWebSocketClient:
         Args:
             bars_data: List of bar dictionaries from WebSocket
         """
-        # Convert to OHLCV objects
-        bars = [
-            OHLCV(
-                time=bar["time"],
-                open=bar["open"],
-                high=bar["high"],
-                low=bar["low"],
-                close=bar["close"],
-                volume=bar["volume"]
+        # Parse straight into SoA arrays - six typed columns built with
+        # np.fromiter instead of one OHLCV object allocation per bar
+        n = len(bars_data)
+        arr = OHLCVArray(
+            times=np.fromiter((b["time"] for b in bars_data), dtype=np.float64, count=n),
+            opens=np.fromiter((b["open"] for b in bars_data), dtype=np.float64, count=n),
+            highs=np.fromiter((b["high"] for b in bars_data), dtype=np.float64, count=n),
+            lows=np.fromiter((b["low"] for b in bars_data), dtype=np.float64, count=n),
+            closes=np.fromiter((b["close"] for b in bars_data), dtype=np.float64, count=n),
+            volumes=np.fromiter((b["volume"] for b in bars_data), dtype=np.float64, count=n)
+        )
+
+        logger.debug(f"Processing {n} bars from WebSocket")
+
+        # Feed the whole batch to the aggregator; the merged result covers
+        # every timeframe updated by this burst. Big backfill bursts run in
+        # a worker thread so the loop stays responsive; the ingest coroutine
+        # still awaits the result, so the aggregator is never re-entered.
+        # Single real-time bars stay inline - they are trivial.
+        if n > self.BURST_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            combined = await loop.run_in_executor(
+                None, self.aggregator.add_1m_bars_bulk, arr
             )
-            for bar in bars_data
-        ]
-
-        logger.debug(f"Processing {len(bars)} bars from WebSocket")
-
-        # Add each bar to aggregator (triggers aggregation to all timeframes)
-        for bar in bars:
-            aggregated = self.aggregator.add_1m_bar(bar)
-
-            # Broadcast to frontend clients if callback registered
-            if self.on_bar_update:
-                for timeframe, timeframe_bars in aggregated.items():
-                    if timeframe_bars:
-                        await self.on_bar_update(timeframe, timeframe_bars)
-
-    async def send_ping(self) -> None:
-        """Send ping message to keep connection alive."""
-        if self.websocket and self.is_connected:
+        else:
+            combined = self.aggregator.add_1m_bars_bulk(arr)
+
+        # Hand the coalesced batch to the broadcast worker without awaiting;
+        # when the queue is full the oldest batch is dropped - stale interim
+        # bar states lose to keeping ingest unblocked
+        if combined and self.on_bar_update:
+            if self._outbound.full():
+                try:
+                    self._outbound.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            self._outbound.put_nowait(combined)
+
+    async def _broadcast_worker(self) -> None:
+        """Drain queued update batches and run the broadcast callback."""
+        while True:
+            updates = await self._outbound.get()
+            if self.on_bar_update is None:
+                continue
             try:
-                await self.websocket.send("ping")
-                logger.debug("Sent ping")
+                await self.on_bar_update(updates)
             except Exception as e:
-                logger.error(f"Error sending ping: {e}")
+                logger.error(f"Broadcast callback error: {e}")
 
     async def close(self) -> None:
-        """Close WebSocket connection."""
+        """Close WebSocket connection and stop the broadcast worker."""
+        self._closing = True
+
+        if self._broadcast_task is not None:
+            self._broadcast_task.cancel()
+            self._broadcast_task = None
+
         if self.websocket:
             await self.websocket.close()
             self.is_connected = False
@@ -265,32 +355,13 @@ class InsightSentryWebSocketClient:
 
         logger.info(f"Successfully switched from {old_symbol} to {new_symbol}")
 
-    def set_bar_update_callback(self, callback: Callable[[str, list[OHLCV]], None]) -> None:
+    def set_bar_update_callback(self, callback: Callable[[dict[str, list[OHLCV]]], None]) -> None:
         """
         Set callback for bar updates (for broadcasting to frontend).
 
         Args:
-            callback: Async function taking (timeframe, bars) arguments
+            callback: Async function taking a {timeframe: bars} dict covering
+                all timeframes updated by one burst
         """
         self.on_bar_update = callback
         logger.info("Bar update callback registered")
-
-
-async def heartbeat(websocket_client: InsightSentryWebSocketClient, interval: int = 15):
-    """
-    Send periodic pings to keep WebSocket connection alive.
-
-    Args:
-        websocket_client: WebSocket client instance
-        interval: Ping interval in seconds (default: 15)
-    """
-    while websocket_client.is_connected:
-        try:
-            await asyncio.sleep(interval)
-            await websocket_client.send_ping()
-        except asyncio.CancelledError:
-            logger.info("Heartbeat cancelled")
-            break
-        except Exception as e:
-            logger.error(f"Heartbeat error: {e}")
-            break
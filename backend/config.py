@@ -4,7 +4,7 @@ Configuration Management
 Purpose: Load environment variables and application configuration.
 """
 
-import os
+from functools import lru_cache
 from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -29,10 +29,14 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get application settings (singleton pattern).
 
+    The .env parse and Pydantic validation run once per process; every
+    later call returns the cached instance.
+
     Returns:
         Settings instance
 
@@ -45,7 +49,7 @@ def get_settings() -> Settings:
 # Convenience function to get API key
 def get_api_key() -> str:
     """
-    Get InsightSentry API key from environment.
+    Get InsightSentry API key from the cached settings.
 
     Returns:
         API key string
@@ -53,10 +57,10 @@ def get_api_key() -> str:
     Raises:
         ValueError: If API key not found in environment
     """
-    api_key = os.getenv("INSIGHTSENTRY_API_KEY")
-    if not api_key:
+    try:
+        return get_settings().INSIGHTSENTRY_API_KEY
+    except Exception as e:
         raise ValueError(
             "INSIGHTSENTRY_API_KEY environment variable not set. "
             "Please create backend/.env file with your API key."
-        )
-    return api_key
+        ) from e
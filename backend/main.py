@@ -14,25 +14,33 @@ Startup Sequence:
 
 import asyncio
 import logging
-from typing import Set
+from collections import deque
+from operator import attrgetter
+from typing import Dict, Optional
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, HTTPException
+import orjson
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from config import get_settings
-from api.cache import get_cache, OHLCV
+from api.cache import get_cache, OHLCV, OHLCVArray
 from api.insight_api import get_api_client, InsightSentryAPI
-from api.websocket_client import InsightSentryWebSocketClient, heartbeat
+from api.websocket_client import InsightSentryWebSocketClient
 from api.aggregator import aggregate_historical_1m_to_timeframe
-from models.schemas import (
-    ChartHistoryRequest,
-    ChartHistoryResponse,
-    OHLCVModel,
-    TimeframeStats,
-    ConnectionStatus
-)
+from api._aggregate_nb import warm_kernels
+from models.schemas import TimeframeStats
+
+# uvloop is optional (not available on Windows): installing its policy makes
+# every loop uvicorn creates a uvloop one, which roughly doubles WebSocket
+# send/recv throughput over the stdlib selector loop
+try:
+    import uvloop
+    uvloop.install()
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -45,9 +53,111 @@ logger = logging.getLogger(__name__)
 cache = get_cache()
 api_client: InsightSentryAPI = None
 ws_client: InsightSentryWebSocketClient = None
-frontend_clients: Set[WebSocket] = set()
+# Each client gets a bounded outbound buffer drained by its own writer task,
+# so one slow socket never back-pressures the aggregator pipeline
 settings = get_settings()
 
+# Per-client outbound buffer depth; a client this far behind is dropped
+CLIENT_QUEUE_SIZE = 256
+
+# Compact bar encoding for broadcast frames: one six-element array
+# [time, open, high, low, close, volume] per bar. The single attrgetter
+# call gathers all six fields in C, and tuples serialize faster than dicts
+_bar_tuple = attrgetter("time", "open", "high", "low", "close", "volume")
+
+
+class _ClientChannel:
+    """
+    Outbound buffer for one client: a plain deque plus a Future waker.
+
+    Lighter than asyncio.Queue on the fan-out path: put() is a deque append
+    plus at most one set_result, and the writer drains the whole backlog per
+    wake-up instead of paying one scheduler hop per frame. Single-threaded
+    by construction - both ends run on the event loop.
+    """
+
+    __slots__ = ("buffer", "waker", "writer")
+
+    def __init__(self):
+        self.buffer: deque = deque()
+        self.waker: Optional[asyncio.Future] = None
+        self.writer: Optional[asyncio.Task] = None
+
+    def put(self, payload: bytes) -> bool:
+        """Buffer a frame; returns False when the client is too far behind."""
+        if len(self.buffer) >= CLIENT_QUEUE_SIZE:
+            return False
+        self.buffer.append(payload)
+
+        waker = self.waker
+        if waker is not None and not waker.done():
+            waker.set_result(None)
+        return True
+
+
+frontend_clients: Dict[WebSocket, _ClientChannel] = {}
+
+
+async def _client_writer(websocket: WebSocket, channel: _ClientChannel) -> None:
+    """
+    Drain a client's outbound buffer onto its socket, sleeping when idle.
+
+    A failed send deregisters the client here, in the one task that owns
+    the socket - broadcasts never mutate the registry mid-iteration, they
+    only observe a client's absence on the next sweep.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            while channel.buffer:
+                await websocket.send_bytes(channel.buffer.popleft())
+            channel.waker = loop.create_future()
+            await channel.waker
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.info(f"Client writer stopped: {e}")
+        frontend_clients.pop(websocket, None)
+
+
+async def _close_client(websocket: WebSocket) -> None:
+    """Close a dropped client's socket; the peer may already be gone."""
+    try:
+        await websocket.close()
+    except Exception as e:
+        logger.debug(f"Error closing dropped client socket: {e}")
+
+
+def _enqueue_broadcast(payload: bytes) -> None:
+    """
+    Push pre-encoded payload bytes to every connected client's buffer.
+
+    put() never awaits, so the caller (the aggregation pipeline) is never
+    blocked by a slow consumer. Clients whose buffer is full are too far
+    behind to catch up and are dropped.
+
+    Task model invariant: the steady-state send path never spawns tasks -
+    create_task is called once per connection (the writer, at accept time)
+    plus once on the rare slow-client teardown below. Per-send task spawning
+    collapses under fan-out load from scheduler overhead alone.
+    """
+    stale_clients = []
+    for client, channel in frontend_clients.items():
+        if not channel.put(payload):
+            logger.warning("Client outbound buffer full - dropping slow client")
+            stale_clients.append(client)
+
+    for client in stale_clients:
+        channel = frontend_clients.pop(client, None)
+        if channel is None:
+            continue
+        # Tear the connection down, not just the registry entry: cancel the
+        # writer parked on its waker and close the socket so the browser's
+        # reconnect logic fires instead of holding a silent connection
+        if channel.writer is not None:
+            channel.writer.cancel()
+        asyncio.create_task(_close_client(client))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -63,6 +173,10 @@ async def lifespan(app: FastAPI):
     global api_client, ws_client
 
     try:
+        # Warm the JIT aggregation kernels off the event loop so the first
+        # chart request does not pay the compile
+        asyncio.create_task(asyncio.to_thread(warm_kernels))
+
         # Initialize API client
         logger.info("Initializing InsightSentry API client...")
         api_client = get_api_client()
@@ -76,32 +190,34 @@ async def lifespan(app: FastAPI):
         )
 
         # Register callback for broadcasting to frontend
-        async def broadcast_bar_update(timeframe: str, bars: list[OHLCV]):
-            """Broadcast aggregated bars to all connected frontend clients."""
+        async def broadcast_bar_update(updates: dict[str, list[OHLCV]]):
+            """Broadcast one coalesced frame covering all updated timeframes."""
+            # Live bars make the pre-serialized history blobs stale - drop
+            # them so the next /api/chart/history hit re-serializes
+            for timeframe in updates:
+                cache.invalidate_payload(ws_client.symbol, timeframe)
+
             if not frontend_clients:
                 return
 
-            message = {
+            # Serialize once with orjson and fan the same bytes out to every
+            # client - send_json would re-encode the payload per client
+            payload = orjson.dumps({
                 "type": "bar_update",
-                "timeframe": timeframe,
-                "bars": [bar.to_dict() for bar in bars]
-            }
-
-            # Send to all connected clients
-            disconnected_clients = set()
-            for client in frontend_clients:
-                try:
-                    await client.send_json(message)
-                except Exception as e:
-                    logger.error(f"Error sending to client: {e}")
-                    disconnected_clients.add(client)
-
-            # Remove disconnected clients
-            frontend_clients.difference_update(disconnected_clients)
+                "updates": {
+                    timeframe: [_bar_tuple(bar) for bar in tf_bars]
+                    for timeframe, tf_bars in updates.items()
+                }
+            })
+
+            # Hand the bytes to every client's writer queue - actual socket
+            # I/O happens in the per-connection writer tasks
+            _enqueue_broadcast(payload)
 
         ws_client.set_bar_update_callback(broadcast_bar_update)
 
-        # Start WebSocket client and heartbeat in background
+        # Start WebSocket client in background (keepalive is handled by the
+        # library's protocol-level ping/pong)
         async def run_ws_client():
             """Run WebSocket client with auto-reconnection."""
             try:
@@ -109,16 +225,7 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 logger.error(f"WebSocket client error: {e}")
 
-        async def run_heartbeat():
-            """Run heartbeat to keep connection alive."""
-            try:
-                await heartbeat(ws_client, interval=15)
-            except Exception as e:
-                logger.error(f"Heartbeat error: {e}")
-
-        # Start background tasks
         asyncio.create_task(run_ws_client())
-        asyncio.create_task(run_heartbeat())
 
         logger.info(f"[OK] WebSocket client started for CME_MINI:MNQ1!")
         logger.info("=" * 60)
@@ -136,6 +243,8 @@ async def lifespan(app: FastAPI):
     logger.info("TradeX Backend shutting down...")
     if ws_client:
         await ws_client.close()
+    if api_client:
+        await api_client.close()
     logger.info("Backend shutdown complete")
 
 
@@ -144,7 +253,8 @@ app = FastAPI(
     title="TradeX Backend",
     description="Real-time trading chart API with WebSocket proxy",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson serialization for all JSON responses
 )
 
 # Configure CORS
@@ -175,7 +285,30 @@ async def health_check():
     }
 
 
-@app.get("/api/chart/history", response_model=ChartHistoryResponse)
+def _chart_history_response(symbol: str, timeframe: str, window, cached: bool) -> Response:
+    """
+    Serialize a chart history response straight to orjson bytes.
+
+    Skips the Pydantic model round-trip entirely: the bars are encoded once
+    from the cache's own representation (bulk SoA dump for OHLCVArray,
+    to_dict per bar otherwise) and spliced into the envelope bytes.
+    """
+    if isinstance(window, OHLCVArray):
+        bars_payload = window.to_json_bytes()
+    else:
+        bars_payload = orjson.dumps([bar.to_dict() for bar in window])
+
+    meta = orjson.dumps({
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "count": len(window),
+        "cached": cached
+    })
+    body = meta[:-1] + b',"bars":' + bars_payload + b"}"
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/api/chart/history")
 async def get_chart_history(
     symbol: str = Query(..., description="Trading symbol (e.g., CME_MINI:MNQ1!)"),
     timeframe: str = Query(..., description="Timeframe (1m, 5m, 15m, 30m, 1H, 4H, 1D, 1W, 1M)"),
@@ -196,13 +329,23 @@ async def get_chart_history(
         cached = cache.get(symbol, timeframe)
         if cached is not None:
             logger.info(f"Cache hit for {symbol} {timeframe}")
-            return ChartHistoryResponse(
-                symbol=symbol,
-                timeframe=timeframe,
-                bars=[OHLCVModel(**bar.to_dict()) for bar in cached[-bars:]],
-                count=len(cached[-bars:]),
-                cached=True
-            )
+
+            # Fast path: the full series was requested, so splice the
+            # pre-serialized bar array into the response body - no per-bar
+            # re-serialization on the hit path
+            if bars >= len(cached):
+                payload = cache.get_payload(symbol, timeframe)
+                if payload is not None:
+                    meta = orjson.dumps({
+                        "symbol": symbol,
+                        "timeframe": timeframe,
+                        "count": len(cached),
+                        "cached": True
+                    })
+                    body = meta[:-1] + b',"bars":' + payload + b"}"
+                    return Response(content=body, media_type="application/json")
+
+            return _chart_history_response(symbol, timeframe, cached[-bars:], cached=True)
 
         # Cache miss - fetch from API
         logger.info(f"Cache miss for {symbol} {timeframe}, fetching from API")
@@ -211,30 +354,18 @@ async def get_chart_history(
         # For 1D, 1W, 1M: fetch 1m data and aggregate
         if timeframe in ["1D", "1W", "1M"]:
             logger.info(f"Fetching 1m data to aggregate to {timeframe}")
-            bars_1m = api_client.fetch_historical_data(symbol, "1m", bars=bars * 1440)
+            bars_1m = await api_client.fetch_historical_data(symbol, "1m", bars=bars * 1440)
             aggregated = aggregate_historical_1m_to_timeframe(bars_1m, timeframe)
 
             # Cache the aggregated result
             cache.set(symbol, timeframe, aggregated)
 
-            return ChartHistoryResponse(
-                symbol=symbol,
-                timeframe=timeframe,
-                bars=[OHLCVModel(**bar.to_dict()) for bar in aggregated[-bars:]],
-                count=len(aggregated[-bars:]),
-                cached=False
-            )
+            return _chart_history_response(symbol, timeframe, aggregated[-bars:], cached=False)
 
         # For 1m - 4H: fetch directly from API
-        ohlcv_bars = api_client.fetch_historical_data(symbol, timeframe, bars)
-
-        return ChartHistoryResponse(
-            symbol=symbol,
-            timeframe=timeframe,
-            bars=[OHLCVModel(**bar.to_dict()) for bar in ohlcv_bars],
-            count=len(ohlcv_bars),
-            cached=False
-        )
+        ohlcv_bars = await api_client.fetch_historical_data(symbol, timeframe, bars)
+
+        return _chart_history_response(symbol, timeframe, ohlcv_bars[-bars:], cached=False)
 
     except ValueError as e:
         logger.error(f"Invalid request: {e}")
@@ -290,22 +421,13 @@ async def subscribe_symbol(
         # Switch symbol
         await ws_client.switch_symbol(symbol)
 
-        # Notify all connected frontend clients
-        notification = {
+        # Notify all connected frontend clients via their writer queues
+        notification = orjson.dumps({
             "type": "symbol_changed",
             "symbol": symbol,
             "message": f"Switched to {symbol}"
-        }
-
-        disconnected_clients = set()
-        for client in frontend_clients:
-            try:
-                await client.send_json(notification)
-            except Exception as e:
-                logger.error(f"Error sending notification to client: {e}")
-                disconnected_clients.add(client)
-
-        frontend_clients.difference_update(disconnected_clients)
+        })
+        _enqueue_broadcast(notification)
 
         logger.info(f"Notified {len(frontend_clients)} clients of symbol change")
 
@@ -332,28 +454,33 @@ async def websocket_chart(websocket: WebSocket):
     WebSocket endpoint for real-time chart updates.
 
     Broadcasts aggregated bar data for all timeframes to connected clients.
-    Message format:
+    All frames are binary (orjson-encoded JSON): byte frames skip UTF-8
+    validation on both ends, so clients must read binary messages.
+    Message format (one frame per update burst; each bar is a compact
+    [time, open, high, low, close, volume] array):
     {
         "type": "bar_update",
-        "timeframe": "1H",
-        "bars": [OHLCV...]
+        "updates": {"1H": [[t, o, h, l, c, v], ...], "1D": [...]}
     }
     """
     await websocket.accept()
-    frontend_clients.add(websocket)
+
+    # Register the client with its outbound buffer and start its writer task
+    channel = _ClientChannel()
+    frontend_clients[websocket] = channel
+    writer_task = asyncio.create_task(_client_writer(websocket, channel))
+    channel.writer = writer_task
 
     logger.info(f"Frontend client connected. Total clients: {len(frontend_clients)}")
 
-    # Send connection status
-    try:
-        await websocket.send_json({
-            "type": "connection_status",
-            "status": "connected" if ws_client and ws_client.is_connected else "connecting",
-            "symbol": "CME_MINI:MNQ1!",
-            "message": "Connected to TradeX backend"
-        })
-    except Exception as e:
-        logger.error(f"Error sending status: {e}")
+    # Send connection status through the buffer so the writer task owns all
+    # outbound frames on this socket
+    channel.put(orjson.dumps({
+        "type": "connection_status",
+        "status": "connected" if ws_client and ws_client.is_connected else "connecting",
+        "symbol": "CME_MINI:MNQ1!",
+        "message": "Connected to TradeX backend"
+    }))
 
     try:
         # Keep connection alive and handle incoming messages
@@ -367,15 +494,17 @@ async def websocket_chart(websocket: WebSocket):
 
             # Handle ping/pong for connection health
             if "bytes" in data:
-                # Echo back bytes for ping/pong
-                await websocket.send_bytes(data["bytes"])
+                # Echo back bytes for ping/pong (via the writer buffer so
+                # only one task ever writes to this socket)
+                channel.put(data["bytes"])
 
     except WebSocketDisconnect:
         logger.info("Frontend client disconnected")
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
     finally:
-        frontend_clients.remove(websocket)
+        writer_task.cancel()
+        frontend_clients.pop(websocket, None)
         logger.info(f"Client removed. Total clients: {len(frontend_clients)}")
 
 
@@ -406,11 +535,15 @@ if __name__ == "__main__":
     import uvicorn
 
     logger.info("Starting TradeX backend server...")
+    if UVLOOP_AVAILABLE:
+        logger.info("Event loop: uvloop")
 
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=settings.BACKEND_PORT,
         log_level=settings.LOG_LEVEL.lower(),
-        reload=False  # Disable auto-reload in production
+        reload=False,  # Disable auto-reload in production
+        ws_max_size=2 ** 22,
+        ws_per_message_deflate=False  # Skip per-frame deflate on broadcasts
     )
@@ -183,7 +183,7 @@ class TradeXApp {
   /**
    * Handle real-time bar update from WebSocket
    * @param {string} timeframe - Timeframe of the update
-   * @param {Array} bars - Array of bars (usually 1 bar)
+   * @param {Array} bars - Bars updated in this burst (chronological)
    */
   handleBarUpdate(timeframe, bars) {
     // Only update if matches current timeframe
@@ -193,9 +193,11 @@ class TradeXApp {
 
     console.log(`[App] Received ${bars.length} bar(s) for ${timeframe}`);
 
-    // Update chart with new bar
+    // Apply each bar in order - a coalesced burst can complete several bars
     if (bars.length > 0) {
-      this.chartManager.updateBar(bars[0]);
+      for (const bar of bars) {
+        this.chartManager.updateBar(bar);
+      }
 
       // Update last update time
       const now = new Date();
@@ -5,6 +5,9 @@
 
 const WS_URL = 'ws://localhost:8000/ws/chart';
 
+// Backend frames are binary orjson-encoded JSON - decode bytes before parsing
+const textDecoder = new TextDecoder();
+
 /**
  * WebSocketClient class
  * Manages WebSocket connection to backend and handles real-time updates
@@ -30,6 +33,8 @@ export class WebSocketClient {
       console.log(`[WS] Connecting to ${this.url}...`);
 
       this.ws = new WebSocket(this.url);
+      // Receive binary frames as ArrayBuffer (not Blob) for synchronous decode
+      this.ws.binaryType = 'arraybuffer';
 
       // Connection opened
       this.ws.addEventListener('open', () => {
@@ -81,11 +86,12 @@ export class WebSocketClient {
 
   /**
    * Handle incoming WebSocket message
-   * @param {string} data - Message data (JSON or text)
+   * @param {string|ArrayBuffer} data - Frame payload (backend sends binary JSON)
    */
   handleMessage(data) {
     try {
-      const message = JSON.parse(data);
+      const text = typeof data === 'string' ? data : textDecoder.decode(data);
+      const message = JSON.parse(text);
 
       // Handle connection status message
       if (message.type === 'connection_status') {
@@ -103,13 +109,19 @@ export class WebSocketClient {
         return;
       }
 
-      // Handle bar update message
+      // Handle bar update message: one frame covers every updated timeframe,
+      // each bar a compact [time, open, high, low, close, volume] array
       if (message.type === 'bar_update') {
-        console.log(`[WS] Bar update: ${message.timeframe} (${message.bars.length} bars)`);
-
-        // Notify callback
-        if (this.onBarUpdate) {
-          this.onBarUpdate(message.timeframe, message.bars);
+        for (const [timeframe, rows] of Object.entries(message.updates)) {
+          const bars = rows.map(([time, open, high, low, close, volume]) => (
+            { time, open, high, low, close, volume }
+          ));
+          console.log(`[WS] Bar update: ${timeframe} (${bars.length} bars)`);
+
+          // Notify callback
+          if (this.onBarUpdate) {
+            this.onBarUpdate(timeframe, bars);
+          }
         }
       }
 